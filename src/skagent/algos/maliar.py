@@ -31,6 +31,17 @@ if TYPE_CHECKING:
     from skagent.bellman import BellmanPeriod
 
 
+def _draw_shock_copies(shocks: dict, n: int, copies: int) -> list[dict]:
+    """
+    Draw ``copies`` independent sets of ``n`` values from each shock.
+
+    All copies are drawn in one stacked :func:`draw_shocks` call and then
+    split by copy.
+    """
+    stacked = draw_shocks(shocks, n=n, big_t=copies)
+    return [{sym: draws[i] for sym, draws in stacked.items()} for i in range(copies)]
+
+
 def generate_givens_from_states(
     states: Grid, model_block: block.Block, shock_copies: int
 ) -> Grid:
@@ -51,11 +62,11 @@ def generate_givens_from_states(
     Grid
         Grid containing states augmented with shock copies.
     """
-    n = states.n()
     new_shock_values = {}
 
-    for i in range(shock_copies):
-        shock_values = draw_shocks(model_block.shocks, n=n)
+    for i, shock_values in enumerate(
+        _draw_shock_copies(model_block.shocks, states.n(), shock_copies)
+    ):
         new_shock_values.update(
             {f"{sym}_{i}": shock_values[sym] for sym in shock_values}
         )
@@ -75,6 +86,9 @@ def simulate_forward(
     """
     Simulate the model forward for a specified number of periods.
 
+    Shocks for the whole horizon are drawn up front, so the time loop only
+    evaluates the decision function and the transition.
+
     Parameters
     ----------
     states_t : Grid or dict
@@ -113,15 +127,16 @@ def simulate_forward(
     if big_t == 0:
         return states_t
 
-    for t in range(big_t):
-        shocks_t = draw_shocks(bellman_period.block.shocks, n=n)
-
-        # Reconcile shock dimensions with state dimensions (see Grid.from_dict())
-        states_template = states_t[next(iter(states_t.keys()))]
-        shocks_t = {
-            sym: utils.reconcile(states_template, shocks_t[sym]) for sym in shocks_t
-        }
+    # Reconcile shock dimensions with state dimensions (see Grid.from_dict()).
+    # The transition preserves the state shape, so one template serves every
+    # period.
+    states_template = states_t[next(iter(states_t.keys()))]
+    shocks_by_t = [
+        {sym: utils.reconcile(states_template, draws[sym]) for sym in draws}
+        for draws in _draw_shock_copies(bellman_period.block.shocks, n, big_t)
+    ]
 
+    for shocks_t in shocks_by_t:
         controls_t = decision_function(states_t, shocks_t, parameters)
 
         states_t = bellman_period.transition_function(
@@ -143,6 +158,8 @@ def _validate_training_inputs(
     epochs_per_iteration,
     states_0_n,
     lr,
+    compile_network=False,
+    simulation_dtype=None,
 ):
     """Validate all inputs for :func:`maliar_training_loop`."""
     if bellman_period is None:
@@ -179,6 +196,15 @@ def _validate_training_inputs(
         )
     if states_0_n.n() < 1:
         raise ValueError("states_0_n must contain at least one state")
+    if not isinstance(compile_network, bool):
+        raise TypeError(
+            f"compile_network must be a bool, got {type(compile_network).__name__}"
+        )
+    if simulation_dtype not in (None, torch.bfloat16, torch.float16):
+        raise ValueError(
+            "simulation_dtype must be None, torch.bfloat16, or torch.float16, "
+            f"got {simulation_dtype!r}"
+        )
 
 
 def _check_convergence(prev_params, curr_params, tolerance, prev_loss, current_loss):
@@ -268,6 +294,8 @@ def maliar_training_loop(
     network_width: int = 16,
     epochs_per_iteration: int = 250,
     lr: float = 0.001,
+    compile_network: bool = False,
+    simulation_dtype: Optional[torch.dtype] = None,
 ) -> tuple:
     r"""
     Run the Maliar, Maliar, and Winant (JME '21) training loop.
@@ -330,6 +358,22 @@ def maliar_training_loop(
         Learning rate for the internal Adam optimizer. The optimizer is
         created once and reused across iterations to preserve momentum.
         Must be > 0. Default is 0.001.
+    compile_network : bool, optional
+        If True, compile the policy network's forward pass with
+        ``torch.compile`` so the small MLP and its bound scaling run as fused
+        kernels rather than one launch per layer and activation. Training and
+        forward simulation both evaluate the network on the fixed-size
+        ``states_0_n`` panel, so the graph is compiled for static shapes;
+        calling the returned network at other batch sizes triggers a
+        recompile. The one-off compilation cost only pays off for long runs.
+        Default is False.
+    simulation_dtype : torch.dtype, optional
+        If ``torch.bfloat16`` or ``torch.float16``, run the forward-simulation
+        step under ``torch.autocast`` at that precision. Simulation only
+        generates the next training states, so it never needs FP32 gradients;
+        the network weights, the optimizer, and the training step stay in
+        FP32. Simulated states are cast back to the dtype of ``states_0_n``.
+        Default is None (full precision).
 
     Returns
     -------
@@ -346,9 +390,11 @@ def maliar_training_loop(
     ValueError
         If max_iterations < 1, tolerance <= 0, shock_copies < 1,
         simulation_steps < 1, network_width < 1, epochs_per_iteration < 1,
-        or states_0_n contains no states.
+        states_0_n contains no states, or simulation_dtype is not a supported
+        reduced-precision dtype.
     TypeError
-        If bellman_period is None or loss_function is not callable.
+        If bellman_period is None, loss_function is not callable, or
+        compile_network is not a bool.
     """
     _validate_training_inputs(
         bellman_period,
@@ -362,19 +408,25 @@ def maliar_training_loop(
         epochs_per_iteration,
         states_0_n,
         lr,
+        compile_network,
+        simulation_dtype,
     )
 
     if random_seed is not None:
         torch.manual_seed(random_seed)
 
     bpn = ann.BlockPolicyNet(bellman_period, width=network_width)
-    optimizer = torch.optim.Adam(bpn.parameters(), lr=lr)
+    if compile_network:
+        bpn.compile(dynamic=False)
+    # Created by the first train_block_nn call and threaded back in after.
+    optimizer = None
     states = states_0_n
     prev_loss = None
+    # Simulation does not touch the weights, so each iteration's post-training
+    # snapshot doubles as the next iteration's baseline.
+    prev_params = utils.extract_parameters(bpn)
 
     for iteration in range(max_iterations):
-        prev_params = utils.extract_parameters(bpn)
-
         givens = generate_givens_from_states(states, bellman_period.block, shock_copies)
 
         bpn, current_loss, optimizer = ann.train_block_nn(
@@ -382,6 +434,7 @@ def maliar_training_loop(
             givens,
             loss_function,
             epochs=epochs_per_iteration,
+            lr=lr,
             optimizer=optimizer,
         )
 
@@ -406,18 +459,30 @@ def maliar_training_loop(
             loss_converged,
         )
         prev_loss = current_loss
+        prev_params = curr_params
 
         if converged:
             break
 
-        next_states = simulate_forward(
-            states,
-            bellman_period,
-            bpn.get_decision_function(),
-            parameters,
-            simulation_steps,
+        # The simulated states are only used as the next training data, so no
+        # autograd graph is recorded for the rollout.
+        autocast = torch.autocast(
+            device_type=bpn.device.type,
+            dtype=simulation_dtype,
+            enabled=simulation_dtype is not None,
+        )
+        with torch.no_grad(), autocast:
+            next_states = simulate_forward(
+                states,
+                bellman_period,
+                bpn.get_decision_function(),
+                parameters,
+                simulation_steps,
+            )
+        states_dtype = states.values.dtype
+        states = Grid.from_dict(
+            {k: v.detach().to(states_dtype) for k, v in next_states.items()}
         )
-        states = Grid.from_dict({k: v.detach() for k, v in next_states.items()})
     else:
         logging.warning(
             f"Training completed without convergence after {max_iterations} iterations."
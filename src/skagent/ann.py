@@ -8,6 +8,16 @@ from typing import Callable, Optional
 device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
 
+def _tensor_size(d):
+    """Number of elements in the first array-like value of *d* (1 if none)."""
+    for value in d.values():
+        if hasattr(value, "numel"):  # PyTorch tensor
+            return value.numel()
+        elif hasattr(value, "size"):  # NumPy array or other array-like
+            return value.size
+    return 1  # No tensors found
+
+
 class BellmanPeriodMixin:
     """
     Mixin class providing common Bellman period initialization for Block*Net classes.
@@ -29,7 +39,7 @@ class BellmanPeriodMixin:
         """Map states, shocks, and parameters to a controls dict.
 
         Implemented by each concrete network; declared here as the contract
-        that :meth:`get_decision_function` closes over.
+        that :meth:`get_decision_function` returns.
         """
         raise NotImplementedError
 
@@ -124,12 +134,12 @@ class BellmanPeriodMixin:
         return ub - torch.nn.functional.softplus(x1)
 
     def get_decision_function(self):
-        """Return a closure ``(states, shocks, parameters) -> controls dict``."""
+        """Return ``(states, shocks, parameters) -> controls dict``.
 
-        def df(states_t, shocks_t, parameters):
-            return self.decision_function(states_t, shocks_t, parameters)
-
-        return df
+        This is the bound :meth:`decision_function` itself rather than a
+        forwarding closure, so each call in a rollout saves a Python frame.
+        """
+        return self.decision_function
 
 
 ##########
@@ -440,21 +450,11 @@ class BlockPolicyNet(BellmanPeriodMixin, Net):
         iset_dict = self.bellman_period.compute_pre_state(
             self.control_sym, states_t, shocks=shocks_t, parameters=parameters
         )
-        # Stack iset values as rows, then transpose to shape (n_samples, n_iset)
+        # The decision rule stacks these as columns, shape (n_samples, n_iset),
         # for batch matrix operations.
         iset_vals = [iset_dict[isym].flatten() for isym in self.iset]
 
-        def get_tensor_size(d):
-            for value in d.values():
-                if hasattr(value, "numel"):  # PyTorch tensor
-                    return value.numel()
-                elif hasattr(value, "size"):  # NumPy array or other array-like
-                    return value.size
-            return 1  # No tensors found
-
-        output = self.get_decision_rule(length=get_tensor_size(iset_dict))[
-            self.control_sym
-        ](*iset_vals)
+        output = self._evaluate_rule(iset_vals, _tensor_size(iset_dict))
 
         decisions = {self.control_sym: output}
         return decisions
@@ -491,22 +491,27 @@ class BlockPolicyNet(BellmanPeriodMixin, Net):
 
             decisions - array
             """
-            if len(information) > 0:
-                input_tensor = torch.stack(information).T
-                input_tensor = input_tensor.to(device)
-            else:
-                batch_size = length
+            return self._evaluate_rule(information, length)
 
-                if batch_size is None:
-                    raise Exception(
-                        "You must pass a tensor length when creating a decision rule"
-                        " with an empty information set."
-                    )
-                input_tensor = torch.empty(batch_size, 0, device=device)
+        return {self.control_sym: decision_rule}
 
-            return self(input_tensor).flatten()  # application of network
+    def _evaluate_rule(self, information, length=None):
+        """Apply the network to information-set values (the decision rule body)."""
+        # Inputs are expected on the network's device already (see
+        # train_block_nn), so no per-call device transfer is made here.
+        if len(information) > 0:
+            input_tensor = torch.stack(information, dim=1)
+        else:
+            batch_size = length
 
-        return {self.control_sym: decision_rule}
+            if batch_size is None:
+                raise Exception(
+                    "You must pass a tensor length when creating a decision rule"
+                    " with an empty information set."
+                )
+            input_tensor = torch.empty(batch_size, 0, device=self.device)
+
+        return self(input_tensor).flatten()  # application of network
 
 
 class BlockValueNet(BellmanPeriodMixin, Net):
@@ -557,7 +562,7 @@ class BlockValueNet(BellmanPeriodMixin, Net):
             self.control_sym, states_t, shocks=shocks_t, parameters=parameters
         )
         iset_vals = [iset_dict[isym].flatten() for isym in self.iset]
-        input_tensor = torch.stack(iset_vals).T.to(device)
+        input_tensor = torch.stack(iset_vals, dim=1).to(device)
         return self(input_tensor).flatten()
 
     def get_value_function(self):
@@ -626,11 +631,11 @@ class BlockPolicyValueNet(BellmanPeriodMixin, Net):
         # Net: shared backbone with 1 output (policy head)
         super().__init__(n_inputs=len(self.iset), n_outputs=1, width=width, **kwargs)
 
-        # Value head: separate Linear from the shared backbone
-        self.value_output = torch.nn.Linear(width, 1)
+        # Value head: separate Linear from the shared backbone, placed on the
+        # device the backbone already moved to in Net.__init__
+        self.value_output = torch.nn.Linear(width, 1, device=self.device)
         torch.nn.init.normal_(self.value_output.weight, mean=0.0, std=0.05)
         torch.nn.init.zeros_(self.value_output.bias)
-        self.value_output.to(device)
 
     # ------------------------------------------------------------------
     # Forward
@@ -692,36 +697,31 @@ class BlockPolicyValueNet(BellmanPeriodMixin, Net):
         )
         iset_vals = [iset_dict[isym].flatten() for isym in self.iset]
 
-        def get_tensor_size(d):
-            for value in d.values():
-                if hasattr(value, "numel"):
-                    return value.numel()
-                elif hasattr(value, "size"):
-                    return value.size
-            return 1
-
-        dr = self.get_decision_rule(length=get_tensor_size(iset_dict))
-        output = dr[self.control_sym](*iset_vals)
+        output = self._evaluate_rule(iset_vals, _tensor_size(iset_dict))
         return {self.control_sym: output}
 
     def get_decision_rule(self, length=None):
         """Decision rule returning only the policy output."""
 
         def decision_rule(*information):
-            if len(information) > 0:
-                input_tensor = torch.stack(information).T.to(device)
-            else:
-                if length is None:
-                    raise ValueError(
-                        "Must pass tensor length for empty information set in "
-                        f"BlockPolicyValueNet.get_decision_rule for control '{self.control_sym}'."
-                    )
-                input_tensor = torch.empty(length, 0, device=device)
-            policy, _value = self(input_tensor)
-            return policy.flatten()
+            return self._evaluate_rule(information, length)
 
         return {self.control_sym: decision_rule}
 
+    def _evaluate_rule(self, information, length=None):
+        """Apply the policy head to information-set values."""
+        if len(information) > 0:
+            input_tensor = torch.stack(information, dim=1)
+        else:
+            if length is None:
+                raise ValueError(
+                    "Must pass tensor length for empty information set in "
+                    f"BlockPolicyValueNet.get_decision_rule for control '{self.control_sym}'."
+                )
+            input_tensor = torch.empty(length, 0, device=self.device)
+        policy, _value = self(input_tensor)
+        return policy.flatten()
+
     # ------------------------------------------------------------------
     # Value interface
     # ------------------------------------------------------------------
@@ -755,7 +755,7 @@ class BlockPolicyValueNet(BellmanPeriodMixin, Net):
             self.control_sym, states_t, shocks=shocks_t, parameters=parameters
         )
         iset_vals = [iset_dict[isym].flatten() for isym in self.iset]
-        input_tensor = torch.stack(iset_vals).T.to(device)
+        input_tensor = torch.stack(iset_vals, dim=1).to(device)
         _policy, value = self(input_tensor)
         return value.flatten()
 
@@ -790,6 +790,10 @@ def aggregate_net_loss(inputs: Grid, df, loss_function):
     """
     Compute a loss function over a tensor of inputs, given a decision function df.
     Return the mean.
+
+    The losses are reduced on whatever device ``loss_function`` produced them;
+    since ``train_block_nn`` places the inputs on the network's device, that is
+    the network's device in practice.
     """
     losses = loss_function(df, inputs)
     if not isinstance(losses, torch.Tensor):
@@ -797,8 +801,6 @@ def aggregate_net_loss(inputs: Grid, df, loss_function):
             "loss_function must return a torch.Tensor of per-sample losses, "
             f"got {type(losses).__name__}."
         )
-    if losses.device != device:
-        losses = losses.to(device)
     return losses.mean()
 
 
@@ -846,7 +848,8 @@ def train_block_nn(
         Learning rate for Adam optimizer (default 0.01).
     optimizer : torch.optim.Optimizer or None, optional
         Pre-existing optimizer to reuse (preserves momentum across calls).
-        If None, a new Adam optimizer is created.
+        If None, a new Adam optimizer is created, using the fused
+        implementation on CUDA and the multi-tensor (``foreach``) one otherwise.
     grad_clip : float or None, optional
         Maximum gradient norm for clipping (default 1.0). Set to None to disable.
     verbose : bool, optional
@@ -869,13 +872,29 @@ def train_block_nn(
         raise ValueError(f"grad_clip must be > 0 or None, got {grad_clip}")
 
     if optimizer is None:
-        optimizer = torch.optim.Adam(block_policy_nn.parameters(), lr=lr)
+        # Small policy nets have few, small parameter tensors, so the
+        # per-tensor Python loop of the default Adam dominates the update.
+        # Use the fused kernel on CUDA and the multi-tensor path elsewhere.
+        if block_policy_nn.device.type == "cuda":
+            optimizer = torch.optim.Adam(
+                block_policy_nn.parameters(), lr=lr, fused=True
+            )
+        else:
+            optimizer = torch.optim.Adam(
+                block_policy_nn.parameters(), lr=lr, foreach=True
+            )
+
+    # Decision rules feed their inputs straight into the network, so place the
+    # grid on the network's device once here rather than on every forward pass.
+    net_device = block_policy_nn.device
+    if isinstance(inputs.values, torch.Tensor) and inputs.values.device != net_device:
+        inputs = Grid(inputs.labels, inputs.values.to(net_device), torched=False)
 
     # NaN sentinel (overwritten on the first epoch; epochs >= 1 is validated
     # above). Typing it as float keeps the return contract free of None.
     final_loss = float("nan")
     for epoch in range(epochs):
-        optimizer.zero_grad()
+        optimizer.zero_grad(set_to_none=True)
         loss = aggregate_net_loss(
             inputs, block_policy_nn.get_core_function(length=inputs.n()), loss_function
         )
@@ -101,6 +101,11 @@ class BellmanPeriod:
         self.discount_variable = discount_variable
         self.decision_rules = decision_rules
         self.arrival_states = self.block.get_arrival_states(calibration)
+        # Placeholder rules for running dynamics up to (not through) a control;
+        # see compute_pre_state.
+        self._placeholder_rules = {cs: (lambda: 1) for cs in self.get_controls()}
+        # Reward symbols per agent, filled lazily by _reward_syms.
+        self._reward_syms_by_agent: dict[str | None, tuple[str, ...]] = {}
 
     def _resolve_inputs(
         self,
@@ -149,17 +154,31 @@ class BellmanPeriod:
         ValueError
             If no reward variables match the given agent.
         """
-        reward_vars = [
+        return list(self._reward_syms(agent))
+
+    def _reward_syms(self, agent: str | None = None) -> tuple[str, ...]:
+        """Cached, read-only form of :meth:`get_reward_syms`.
+
+        ``block.reward`` is fixed for the life of the period, so the filtered
+        symbols are computed once per agent rather than on every reward
+        evaluation.
+        """
+        try:
+            return self._reward_syms_by_agent[agent]
+        except KeyError:
+            pass
+        reward_vars = tuple(
             sym
             for sym in self.block.reward
             if agent is None or self.block.reward[sym] == agent
-        ]
+        )
         if not reward_vars:
             raise ValueError(
                 f"No reward variables found in block for agent '{agent}'"
                 if agent is not None
                 else "No reward variables found in block"
             )
+        self._reward_syms_by_agent[agent] = reward_vars
         return reward_vars
 
     def get_reward_sym(self, agent: str | None = None) -> str:
@@ -173,7 +192,7 @@ class BellmanPeriod:
         ValueError
             If no reward variables match the given agent.
         """
-        return self.get_reward_syms(agent)[0]
+        return self._reward_syms(agent)[0]
 
     def compute_pre_state(
         self,
@@ -195,13 +214,12 @@ class BellmanPeriod:
         iset = self.block.dynamics[control_sym].iset
         shocks = shocks if shocks is not None else {}
         params = parameters if parameters is not None else self.calibration
-        vals = params | states | shocks
+        vals = {**params, **states, **shocks}
 
         if all(isym in vals for isym in iset):
             return {isym: vals[isym] for isym in iset}
 
-        drs = {cs: (lambda: 1) for cs in self.get_controls()}
-        out = self.block.transition(vals, drs, until=control_sym)
+        out = self.block.transition(vals, self._placeholder_rules, until=control_sym)
         return {isym: out[isym] for isym in iset}
 
     def compute_controls(
@@ -327,7 +345,7 @@ class BellmanPeriod:
             shocks, decision_rules, parameters
         )
 
-        vals = parameters | states | shocks | controls
+        vals = {**parameters, **states, **shocks, **controls}
         post = self.block.transition(vals, decision_rules, fix=list(controls.keys()))
 
         return {sym: post[sym] for sym in self.arrival_states}
@@ -363,7 +381,7 @@ class BellmanPeriod:
             shocks, decision_rules, parameters
         )
 
-        vals = parameters | states | shocks
+        vals = {**parameters, **states, **shocks}
         post = self.block.transition(vals, decision_rules)
         return {sym: post[sym] for sym in decision_rules}
 
@@ -404,9 +422,9 @@ class BellmanPeriod:
             shocks, decision_rules, parameters
         )
 
-        vals = parameters | states | shocks | controls
+        vals = {**parameters, **states, **shocks, **controls}
         post = self.block.transition(vals, decision_rules, fix=list(controls.keys()))
-        return {sym: post[sym] for sym in self.get_reward_syms(agent)}
+        return {sym: post[sym] for sym in self._reward_syms(agent)}
 
     def post_function(
         self,
@@ -445,7 +463,7 @@ class BellmanPeriod:
             shocks, decision_rules, parameters
         )
 
-        vals = parameters | states | shocks | controls
+        vals = {**parameters, **states, **shocks, **controls}
         post = self.block.transition(vals, decision_rules, fix=list(controls.keys()))
         return post
 
@@ -497,7 +515,7 @@ class BellmanPeriod:
         )
 
         # Combine all variables for block evaluation
-        vals = parameters | states | shocks | controls
+        vals = {**parameters, **states, **shocks, **controls}
 
         # Compute rewards using block transition
         post = self.block.transition(vals, decision_rules, fix=list(controls.keys()))
@@ -505,7 +523,7 @@ class BellmanPeriod:
         # the exact computation graph needed for autograd differentiation.
 
         # Filter rewards by agent
-        rewards = {sym: post[sym] for sym in self.get_reward_syms(agent)}
+        rewards = {sym: post[sym] for sym in self._reward_syms(agent)}
 
         # Use utility function to compute gradients
         return compute_gradients_for_tensors(rewards, wrt, create_graph=create_graph)
@@ -735,6 +753,59 @@ def _ensure_grad(
     return c, {**controls, sym: c}
 
 
+def _discounted_sum(period_rewards: list[Any], discount_factors: list[Any]) -> Any:
+    r"""Weight each period's reward by :math:`\prod_{\tau<t} \beta_\tau` and sum.
+
+    When any input is a tensor, the periods are stacked along a leading time
+    axis and reduced in one ``cumprod``/``sum`` pass rather than one
+    broadcast-add per period. Other inputs fall back to scalar accumulation.
+
+    Raises
+    ------
+    ValueError
+        If any period's reward is NaN. For tensors this is checked once on the
+        stacked rewards, so the rollout itself incurs no host-device syncs.
+    """
+    if not period_rewards:
+        return 0.0
+
+    tensors = [
+        v for v in period_rewards + discount_factors if isinstance(v, torch.Tensor)
+    ]
+    if not tensors:
+        total = 0.0
+        cumulative_discount = 1.0  # Π_{τ=0}^{t-1} β_τ
+        for t, (reward, beta) in enumerate(zip(period_rewards, discount_factors)):
+            if np.any(np.isnan(reward)):
+                raise ValueError(f"Calculated reward is NaN in period {t}: {reward}")
+            total += reward * cumulative_discount
+            cumulative_discount = cumulative_discount * beta
+        return total
+
+    dtype = tensors[0].dtype
+    for t in tensors[1:]:
+        dtype = torch.promote_types(dtype, t.dtype)
+    # Non-tensor discount factors are cast to this dtype too, so integer
+    # rewards must not truncate a Python-float β to zero.
+    if not (dtype.is_floating_point or dtype.is_complex):
+        dtype = torch.promote_types(dtype, torch.get_default_dtype())
+    device = tensors[0].device
+
+    # The discount applied to period t is the product of β over periods < t,
+    # so the final period's β never enters the sum.
+    values = period_rewards + [1.0] + discount_factors[:-1]
+    values = torch.broadcast_tensors(
+        *[torch.as_tensor(v, dtype=dtype, device=device) for v in values]
+    )
+    big_t = len(period_rewards)
+    rewards = torch.stack(values[:big_t])
+    betas = torch.stack(values[big_t:])
+    if torch.isnan(rewards).any():
+        t = int(torch.isnan(rewards).reshape(big_t, -1).any(dim=1).nonzero()[0])
+        raise ValueError(f"Calculated reward is NaN in period {t}: {period_rewards[t]}")
+    return (torch.cumprod(betas, dim=0) * rewards).sum(dim=0)
+
+
 def estimate_discounted_lifetime_reward(
     bellman_period: BellmanPeriod,
     dr: dict[str, Callable] | Callable,
@@ -777,10 +848,11 @@ def estimate_discounted_lifetime_reward(
         The total discounted lifetime reward.
     """
     states_t = states_0
-    total_discounted_reward = 0.0
-    cumulative_discount = 1.0  # Π_{τ=0}^{t-1} β_τ
+    period_rewards = []
+    discount_factors = []
 
-    reward_syms = bellman_period.get_reward_syms(agent)
+    reward_syms = bellman_period._reward_syms(agent)
+    arrival_states = bellman_period.arrival_states
 
     for t in range(big_t):
         if shocks_by_t is not None:
@@ -792,37 +864,18 @@ def estimate_discounted_lifetime_reward(
             dr, states_t, shocks=shocks_t, parameters=parameters
         )
 
-        # TODO: can improve performance by consolidating multiple calls
-        #       that simulate forward.
+        # One block transition per period supplies the reward, the discount
+        # factor, and the next arrival states.
         post = bellman_period.post_function(
             states_t, controls_t, shocks=shocks_t, parameters=parameters, agent=agent
         )
-        discount_factor = bellman_period.resolve_discount_factor(post)
+        discount_factors.append(bellman_period.resolve_discount_factor(post))
+        # NaN rewards are detected once after the rollout (see _discounted_sum)
+        period_rewards.append(sum(post[rsym] for rsym in reward_syms))
 
-        reward_t = bellman_period.reward_function(
-            states_t, controls_t, shocks=shocks_t, parameters=parameters, agent=agent
-        )
-
-        period_reward = 0
-        for rsym in reward_syms:
-            if isinstance(reward_t[rsym], torch.Tensor) and torch.any(
-                torch.isnan(reward_t[rsym])
-            ):
-                raise ValueError(f"Calculated reward {rsym} is NaN: {reward_t}")
-            if isinstance(reward_t[rsym], np.ndarray) and np.any(
-                np.isnan(reward_t[rsym])
-            ):
-                raise ValueError(f"Calculated reward {rsym} is NaN: {reward_t}")
-            period_reward += reward_t[rsym]
-
-        total_discounted_reward += period_reward * cumulative_discount
-        cumulative_discount = cumulative_discount * discount_factor
-
-        states_t = bellman_period.transition_function(
-            states_t, controls_t, shocks=shocks_t, parameters=parameters
-        )
+        states_t = {sym: post[sym] for sym in arrival_states}
 
-    return total_discounted_reward
+    return _discounted_sum(period_rewards, discount_factors)
 
 
 def estimate_bellman_residual(
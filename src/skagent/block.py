@@ -11,6 +11,7 @@ from skagent.distributions import (
     expected,
 )
 from inspect import signature
+import weakref
 import numpy as np
 from skagent.model_analyzer import ModelAnalyzer
 from skagent.model_visualizer import ModelVisualizer
@@ -154,6 +155,28 @@ def construct_shocks(shock_data, scope, rng=None):
     return sd
 
 
+_PARAMETER_NAMES = weakref.WeakKeyDictionary()
+
+
+def _parameter_names(fun):
+    """
+    Returns the names of the arguments of ``fun``.
+
+    ``inspect.signature`` costs about as much as evaluating a vectorized
+    equation, and the same equations are evaluated every period of a
+    simulation, so the names are cached per function object.
+    """
+    try:
+        return _PARAMETER_NAMES[fun]
+    except KeyError:
+        names = tuple(signature(fun).parameters)
+        _PARAMETER_NAMES[fun] = names
+        return names
+    except TypeError:
+        # not weak-referenceable or not hashable, e.g. builtins
+        return tuple(signature(fun).parameters)
+
+
 def simulate_dynamics(
     dynamics: Mapping[str, Union[Callable, Control]],
     pre: Mapping[str, Any],
@@ -202,10 +225,10 @@ def simulate_dynamics(
                         for var in vals
                     }
                     vals[sym][i] = dr[sym][i](
-                        *[vals_i[var] for var in signature(dr[sym][i]).parameters]
+                        *[vals_i[var] for var in _parameter_names(dr[sym][i])]
                     )
             else:
-                if len(signature(dr[sym]).parameters) > 0:
+                if len(_parameter_names(dr[sym])) > 0:
                     try:
                         vals[sym] = dr[sym](
                             *[
@@ -222,9 +245,7 @@ def simulate_dynamics(
             if isinstance(update_fn, Rule):
                 update_fn = update_fn.update_func()
 
-            vals[sym] = update_fn(
-                *[vals[var] for var in signature(update_fn).parameters]
-            )
+            vals[sym] = update_fn(*[vals[var] for var in _parameter_names(update_fn)])
 
     return vals
 
@@ -558,9 +579,7 @@ class DBlock(Block):
             update_fn = self.dynamics[sym]
             if isinstance(update_fn, Rule):
                 update_fn = update_fn.update_func()
-            rvals[sym] = update_fn(
-                *[vals[var] for var in signature(update_fn).parameters]
-            )
+            rvals[sym] = update_fn(*[vals[var] for var in _parameter_names(update_fn)])
 
         return rvals
 
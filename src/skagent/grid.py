@@ -25,6 +25,9 @@ class Grid:
     def __init__(self, labels, values, torched=True):
         self.labels = labels
         self.values = values
+        # Column of each label in `values`, so single-variable access is a
+        # slice rather than a rebuild of the whole dict.
+        self.columns = {label: i for i, label in enumerate(labels)}
 
         if torched:
             self.torch()
@@ -38,9 +41,9 @@ class Grid:
         vals = [utils.reconcile(list(kv.values())[0], val) for val in list(kv.values())]
 
         if isinstance(vals[0], np.ndarray):
-            vals_stacked = np.stack(vals).T
+            vals_stacked = np.stack(vals, axis=1)
         elif isinstance(vals[0], torch.Tensor):
-            vals_stacked = torch.stack(vals).T
+            vals_stacked = torch.stack(vals, dim=1)
         else:
             raise Exception(f"First value is over unexpected type {type(vals[0])}")
 
@@ -86,10 +89,12 @@ class Grid:
         return Grid.from_dict(my_dict)
 
     def __getitem__(self, sym):
-        # TODO: fix the dict creation step to improve performance
-        return self.to_dict()[sym]
+        return self.values[:, self.columns[sym]]
 
-    # TODO: To imitate dict-like properties, may need to implement __contains__ and __iter__
+    def __contains__(self, sym):
+        return sym in self.columns
+
+    # TODO: To imitate dict-like properties, may need to implement __iter__
     #       or alternatively rewrite to use a Mappable base class.
 
     def __str__(self):
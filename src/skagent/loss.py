@@ -187,37 +187,51 @@ class EstimatedDiscountedLifetimeRewardLoss:
         self.arrival_variables = self.bellman_period.arrival_states
         self.big_t = big_t
 
-    def __call__(self, df: Callable, input_grid: Grid):
-        # convoluted
-        shock_vars = self.bellman_period.get_shocks()
-        big_t_shock_syms = sum(
-            [
-                [f"{sym}_{t}" for sym in list(shock_vars.keys())]
-                for t in range(self.big_t)
-            ],
-            [],
-        )
         # TODO: codify this encoding and decoding of the grid into a separate object
         # It is specifically the EDLR loss function that requires big_t of the shocks.
         # other AiO loss functions use 2 copies of the shocks only.
+        self.shock_syms = list(self.bellman_period.get_shocks().keys())
+        self.shock_keys_by_t = [
+            [f"{sym}_{t}" for t in range(self.big_t)] for sym in self.shock_syms
+        ]
 
-        # includes the values of state_0 variables, and shocks.
-        given_vals = input_grid.to_dict()
+        # Column indices of the shock keys, cached per grid label layout and
+        # device.
+        self._shock_layout = None
+        self._shock_index = None
 
-        shock_vals = {sym: given_vals[sym] for sym in big_t_shock_syms}
-        shocks_by_t = {
-            sym: torch.stack([shock_vals[f"{sym}_{t}"] for t in range(self.big_t)])
-            for sym in shock_vars
-        }
+    def _shocks_by_t(self, input_grid: Grid) -> dict:
+        """Gather every ``{sym}_{t}`` column of *input_grid* in one indexing op.
 
+        Returns a dict mapping each shock symbol to a ``(big_t, n)`` tensor,
+        without per-period stacking or string lookups on the hot path.
+        """
+        if not self.shock_syms:
+            return {}
+
+        layout = (tuple(input_grid.labels), input_grid.values.device)
+        if layout != self._shock_layout:
+            column = input_grid.columns
+            self._shock_index = torch.tensor(
+                [[column[key] for key in keys] for keys in self.shock_keys_by_t],
+                device=input_grid.values.device,
+            )
+            self._shock_layout = layout
+
+        # values[:, index] has shape (n, n_shocks, big_t)
+        shock_panel = input_grid.values[:, self._shock_index].permute(1, 2, 0)
+        return dict(zip(self.shock_syms, shock_panel))
+
+    def __call__(self, df: Callable, input_grid: Grid):
+        # includes the values of state_0 variables, and shocks.
         edlr = estimate_discounted_lifetime_reward(
             self.bellman_period,
             df,
-            {sym: given_vals[sym] for sym in self.arrival_variables},
+            {sym: input_grid[sym] for sym in self.arrival_variables},
             self.big_t,
             parameters=self.parameters,
             agent=None,  # TODO: Pass through the agent?
-            shocks_by_t=shocks_by_t,
+            shocks_by_t=self._shocks_by_t(input_grid),
             # Handle multiple decision rules?
         )
         return -edlr
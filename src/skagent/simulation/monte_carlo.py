@@ -24,6 +24,7 @@ def draw_shocks(
     conditions: Sequence[int] = (),
     n=None,
     rng: np.random.Generator | None = None,
+    big_t: int | None = None,
 ):
     """
     Draw from each shock distribution values, subject to given conditions.
@@ -45,6 +46,11 @@ def draw_shocks(
         Random number generator to use for drawing. If provided, will be used for
         distributions that support it.
 
+    big_t : int (optional)
+        If given, draw ``big_t`` independent periods at once and stack them
+        along a new leading axis, so ``draws[sym][t]`` is the draw for period
+        ``t``. Per-agent distributions are sampled in a single call.
+
     Returns
     -------
     draws : Mapping[str, Sequence]
@@ -59,12 +65,15 @@ def draw_shocks(
         shock = shocks[shock_var]
 
         if isinstance(shock, (int, float)):
-            draws[shock_var] = np.ones(n) * shock
+            draws[shock_var] = np.ones(n if big_t is None else (big_t, n)) * shock
         elif isinstance(shock, Aggregate):
             # For Aggregate shocks, set RNG if the distribution supports it
             if rng is not None and hasattr(shock.dist, "rng"):
                 shock.dist.rng = rng
-            draws[shock_var] = shock.dist.draw(1)[0]
+            if big_t is None:
+                draws[shock_var] = shock.dist.draw(1)[0]
+            else:
+                draws[shock_var] = shock.dist.draw(big_t)
         elif isinstance(shock, IndexDistribution) or isinstance(
             shock, TimeVaryingDiscreteDistribution
         ):
@@ -72,12 +81,21 @@ def draw_shocks(
             # For index-varying distributions, set RNG if supported
             if rng is not None and hasattr(shock, "rng"):
                 shock.rng = rng
-            draws[shock_var] = shock.draw(conditions)
+            if big_t is None:
+                draws[shock_var] = shock.draw(conditions)
+            else:
+                draws[shock_var] = np.stack(
+                    [shock.draw(conditions) for _ in range(big_t)]
+                )
         else:
             # For regular distributions, set RNG if the distribution supports it
             if rng is not None and hasattr(shock, "rng"):
                 shock.rng = rng
-            draws[shock_var] = shock.draw(n)
+            if big_t is None:
+                draws[shock_var] = shock.draw(n)
+            else:
+                drawn = shock.draw(big_t * n)
+                draws[shock_var] = drawn.reshape(big_t, n, *drawn.shape[1:])
             # this is hacky if there are no conditions.
 
     return draws
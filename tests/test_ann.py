@@ -58,6 +58,18 @@ class test_ann_lr(unittest.TestCase):
             torch.allclose(c_ann, torch.zeros(c_ann.shape).to(device), atol=0.0015)
         )
 
+    def test_get_decision_function_is_bound_method(self):
+        bpn = ann.BlockPolicyNet(case_0["bp"], width=16)
+        df = bpn.get_decision_function()
+
+        self.assertEqual(df, bpn.decision_function)
+        states = case_0["givens"].to_dict()
+        self.assertTrue(
+            torch.equal(
+                df(states, {}, {})["c"], bpn.decision_function(states, {}, {})["c"]
+            )
+        )
+
     def test_case_1(self):
         edlrl = loss.EstimatedDiscountedLifetimeRewardLoss(
             case_1["bp"],
@@ -296,6 +308,18 @@ class test_ann_lr(unittest.TestCase):
             )
         )
 
+    def test_empty_information_set_input_on_network_device(self):
+        # The meta device differs from the module-level default, so an input
+        # allocated anywhere but the network's own device would fail here.
+        for net in (
+            ann.BlockPolicyNet(case_9["bp"], width=8),
+            ann.BlockPolicyValueNet(case_9["bp"], width=8),
+        ):
+            net.to("meta")
+            c = net._evaluate_rule([], length=3)
+            self.assertEqual(c.device.type, "meta")
+            self.assertEqual(c.shape, (3,))
+
     def test_lifetime_reward_perfect_foresight(self):
         ### Model data
 
@@ -539,3 +563,15 @@ class TestTrainBlockNNValidation(unittest.TestCase):
         self.assertTrue(
             np.isfinite(loss), "grad_clip=None run produced a non-finite loss"
         )
+
+    def test_default_optimizer_uses_multi_tensor_adam(self):
+        _, _, optimizer = ann.train_block_nn(
+            self.bpn, self.inputs, self.loss_fn, epochs=1, lr=0.005
+        )
+        self.assertIsInstance(optimizer, torch.optim.Adam)
+        group = optimizer.param_groups[0]
+        self.assertEqual(group["lr"], 0.005)
+        if self.bpn.device.type == "cuda":
+            self.assertTrue(group["fused"])
+        else:
+            self.assertTrue(group["foreach"])
@@ -202,6 +202,80 @@ class TestLifetimeReward(unittest.TestCase):
 
         self.assertEqual(dlr_2, 0)
 
+    def test_state_dependent_discount(self):
+        """Per-sample, time-varying discount factors compound period by period."""
+        block = model.DBlock(
+            name="state_dependent_discount",
+            dynamics={
+                "c": model.Control(["a"]),
+                "b": lambda a: 0.9 + 0.01 * a,
+                "u": lambda c: c,
+                "a": lambda a, c: a - c + 1.0,
+            },
+            reward={"u": "consumer"},
+        )
+        bp = bellman.BellmanPeriod(block, "b", {})
+        dr = {"c": lambda a: a / 2}
+        a = torch.tensor([1.0, 2.0, 4.0])
+
+        dlr = bellman.estimate_discounted_lifetime_reward(bp, dr, {"a": a}, 3)
+
+        expected = torch.zeros_like(a)
+        cumulative_discount = torch.ones_like(a)
+        for _ in range(3):
+            c = a / 2
+            expected = expected + c * cumulative_discount
+            cumulative_discount = cumulative_discount * (0.9 + 0.01 * a)
+            a = a - c + 1.0
+
+        self.assertEqual(dlr.shape, (3,))
+        self.assertTrue(torch.allclose(dlr, expected))
+
+    def test_integer_rewards_keep_float_discount(self):
+        """Integer reward tensors must not truncate a float discount factor."""
+        block = model.DBlock(
+            name="integer_reward",
+            dynamics={
+                "c": model.Control(["a"]),
+                "u": lambda c: c,
+                "a": lambda a: a,
+            },
+            reward={"u": "consumer"},
+        )
+        bp = bellman.BellmanPeriod(block, "beta", {"beta": 0.9})
+
+        dlr = bellman.estimate_discounted_lifetime_reward(
+            bp, {"c": lambda a: a}, {"a": torch.tensor([1, 2])}, 3
+        )
+
+        self.assertTrue(dlr.is_floating_point())
+        self.assertTrue(torch.allclose(dlr, torch.tensor([2.71, 5.42])))
+
+    def test_nan_reward_raises(self):
+        """A NaN reward in any period is reported after the rollout."""
+        block = model.DBlock(
+            name="nan_reward",
+            shocks={"y": Normal(mu=1.0, sigma=0.1)},
+            dynamics={
+                "m": lambda a, y: a + y,
+                "c": model.Control(["m"]),
+                "u": lambda c: torch.log(c),
+                "a": lambda m, c: m - c,
+            },
+            reward={"u": "consumer"},
+        )
+        bp = bellman.BellmanPeriod(block, "beta", {"beta": 0.9})
+        shocks_by_t = {"y": torch.tensor([[1.0, 1.0], [-10.0, 1.0]])}
+
+        with self.assertRaisesRegex(ValueError, "NaN in period 1"):
+            bellman.estimate_discounted_lifetime_reward(
+                bp,
+                {"c": lambda m: m / 2},
+                {"a": torch.tensor([2.0, 4.0])},
+                2,
+                shocks_by_t=shocks_by_t,
+            )
+
 
 class TestGradRewardFunction(unittest.TestCase):
     """
@@ -541,6 +615,17 @@ class TestGetRewardSymsErrors(unittest.TestCase):
         with self.assertRaises(ValueError, msg="No reward variables found"):
             bp.get_reward_syms()
 
+    def test_returned_list_is_a_copy(self):
+        block = model.DBlock(
+            name="test",
+            dynamics={"u": lambda c: c},
+            reward={"u": "consumer"},
+        )
+        bp = bellman.BellmanPeriod(block, "beta", {"beta": 0.9})
+
+        bp.get_reward_syms().append("x")
+        self.assertEqual(bp.get_reward_syms(), ["u"])
+
 
 class TestExtractPeriodShocksErrors(unittest.TestCase):
     """Test _extract_period_shocks error handling."""
@@ -106,3 +106,12 @@ class test_grid_alt_constructors(unittest.TestCase):
 
         self.assertEqual(g2.len(), 2)
         self.assertEqual(g2.n(), 3)
+
+    def test_getitem_matches_to_dict(self):
+        g = grid.Grid.from_config(self.config)
+        as_dict = g.to_dict()
+
+        for sym in self.config:
+            self.assertTrue(torch.equal(g[sym], as_dict[sym]))
+        self.assertIn("a", g)
+        self.assertNotIn("c", g)
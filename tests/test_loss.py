@@ -1,8 +1,14 @@
-from conftest import case_0
+from conftest import case_0, case_1
 import numpy as np
 import os
 import skagent.ann as ann
-from skagent.loss import CustomLoss, static_reward
+from skagent.bellman import estimate_discounted_lifetime_reward
+from skagent.loss import (
+    CustomLoss,
+    EstimatedDiscountedLifetimeRewardLoss,
+    static_reward,
+)
+from skagent.grid import Grid
 import torch
 import unittest
 
@@ -43,3 +49,43 @@ class TestLossFunctions(unittest.TestCase):
         self.assertTrue(
             torch.allclose(c_ann, torch.zeros(c_ann.shape).to(device), atol=0.0015)
         )
+
+    def test_edlr_loss_shock_layout(self):
+        """Shock columns are gathered per period regardless of grid label order."""
+        bp = case_1["bp"]
+        givens = case_1["givens"][2]
+        edlrl = EstimatedDiscountedLifetimeRewardLoss(bp, 2, case_1["calibration"])
+        dr = {"c": lambda a, theta: theta / 2}
+
+        given_vals = givens.to_dict()
+        expected = -estimate_discounted_lifetime_reward(
+            bp,
+            dr,
+            {"a": given_vals["a"]},
+            2,
+            shocks_by_t={
+                "theta": torch.stack([given_vals["theta_0"], given_vals["theta_1"]])
+            },
+            parameters=case_1["calibration"],
+        )
+        self.assertTrue(torch.allclose(edlrl(dr, givens), expected))
+
+        # Reordering the grid columns must invalidate the cached indices.
+        reordered = Grid.from_dict(
+            {sym: given_vals[sym] for sym in ["theta_1", "a", "theta_0"]}
+        ).torch()
+        self.assertTrue(torch.allclose(edlrl(dr, reordered), expected))
+
+    @unittest.skipUnless(torch.cuda.is_available(), "requires CUDA")
+    def test_edlr_loss_shock_layout_across_devices(self):
+        """The cached shock indices follow the device of each grid."""
+        bp = case_1["bp"]
+        edlrl = EstimatedDiscountedLifetimeRewardLoss(bp, 2, case_1["calibration"])
+        dr = {"c": lambda a, theta: theta / 2}
+
+        givens = case_1["givens"][2]
+        cuda_grid = Grid(givens.labels, givens.values.cuda(), torched=False)
+        cpu_grid = Grid(givens.labels, givens.values.cpu(), torched=False)
+
+        expected = edlrl(dr, cuda_grid).cpu()
+        self.assertTrue(torch.allclose(edlrl(dr, cpu_grid), expected))
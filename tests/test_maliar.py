@@ -119,6 +119,25 @@ class TestGridManipulations(unittest.TestCase):
 
         self.assertEqual(len(full_grid["psi_0"]), 7)
 
+    def test_givens_shock_copies_are_independent(self):
+        block = case_1["block"]
+        block.construct_shocks(
+            case_1["calibration"], rng=np.random.default_rng(TEST_SEED)
+        )
+
+        state_grid = grid.Grid.from_config(
+            {
+                "a": {"min": 0, "max": 1, "count": 7},
+            }
+        )
+
+        full_grid = maliar.generate_givens_from_states(state_grid, block, 3)
+
+        for i in range(3):
+            self.assertEqual(full_grid[f"theta_{i}"].shape.numel(), 7)
+        self.assertFalse(torch.equal(full_grid["theta_0"], full_grid["theta_1"]))
+        self.assertFalse(torch.equal(full_grid["theta_1"], full_grid["theta_2"]))
+
 
 class TestMaliarTrainingLoop(unittest.TestCase):
     def setUp(self):
@@ -1450,6 +1469,22 @@ class TestSimulateForwardHappyPath(unittest.TestCase):
         self.assertEqual(result["m"].shape, self.states["m"].shape)
         self.assertEqual(result["g"].shape, self.states["g"].shape)
 
+    def test_each_period_sees_fresh_shocks(self):
+        """Pre-drawn shocks give every period its own state-shaped draw."""
+        seen = []
+
+        def policy(s, sh, p):
+            seen.append(sh)
+            return self.policy(s, sh, p)
+
+        maliar.simulate_forward(self.states, self.bp, policy, {}, big_t=3)
+
+        self.assertEqual(len(seen), 3)
+        for sym in self.bp.get_shocks():
+            for shocks_t in seen:
+                self.assertEqual(shocks_t[sym].shape, self.states["m"].shape)
+            self.assertFalse(torch.equal(seen[0][sym], seen[1][sym]))
+
 
 class TestMaliarTrainingLoopValidation(unittest.TestCase):
     """Test input validation in maliar_training_loop."""
@@ -1678,6 +1713,61 @@ class TestMaliarHyperparameters(unittest.TestCase):
             "Wider network should have more parameters",
         )
 
+    def test_compile_network_matches_eager(self):
+        net_compiled, _ = maliar.maliar_training_loop(
+            self.bp,
+            self.loss_fn,
+            self.states,
+            self.calibration,
+            max_iterations=1,
+            epochs_per_iteration=5,
+            random_seed=TEST_SEED,
+            compile_network=True,
+        )
+
+        # Compilation leaves the parameters and state_dict keys untouched, so
+        # an eager copy of the trained weights must reproduce its outputs.
+        net_eager = BlockPolicyNet(self.bp, width=16)
+        net_eager.load_state_dict(net_compiled.state_dict())
+
+        x = self.states.values
+        self.assertTrue(torch.allclose(net_compiled(x), net_eager(x), atol=1e-6))
+
+    def test_reduced_precision_simulation(self):
+        _, states = maliar.maliar_training_loop(
+            self.bp,
+            self.loss_fn,
+            self.states,
+            self.calibration,
+            max_iterations=2,
+            epochs_per_iteration=5,
+            random_seed=TEST_SEED,
+            simulation_dtype=torch.bfloat16,
+        )
+
+        self.assertEqual(states.values.dtype, self.states.values.dtype)
+        self.assertTrue(torch.all(torch.isfinite(states.values)))
+
+    def test_unsupported_simulation_dtype_raises(self):
+        with self.assertRaises(ValueError):
+            maliar.maliar_training_loop(
+                self.bp,
+                self.loss_fn,
+                self.states,
+                self.calibration,
+                simulation_dtype=torch.float64,
+            )
+
+    def test_non_bool_compile_network_raises(self):
+        with self.assertRaises(TypeError):
+            maliar.maliar_training_loop(
+                self.bp,
+                self.loss_fn,
+                self.states,
+                self.calibration,
+                compile_network="yes",
+            )
+
 
 class TestCheckConvergence(unittest.TestCase):
     """Test _check_convergence helper."""
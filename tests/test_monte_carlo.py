@@ -3,8 +3,11 @@ This file implements unit tests for the Monte Carlo simulation module
 """
 
 import unittest
+from unittest import mock
+import weakref
 
 from skagent.distributions import Bernoulli, IndexDistribution, MeanOneLogNormal
+import skagent.block as block
 from skagent.block import Aggregate, Control, DBlock, simulate_dynamics
 from skagent.simulation.monte_carlo import (
     MonteCarloSimulator,
@@ -47,6 +50,17 @@ class test_draw_shocks(unittest.TestCase):
         self.assertEqual(len(drawn["psi"]), 2)
         self.assertTrue(isinstance(drawn["agg_gro"], float))
 
+    def test_draw_shocks_big_t(self):
+        drawn = draw_shocks(cons_shocks, np.array([0, 1]), big_t=3)
+
+        self.assertEqual(drawn["theta"].shape, (3, 2))
+        self.assertEqual(drawn["psi"].shape, (3, 2))
+        self.assertEqual(drawn["live"].shape, (3, 2))
+        # one aggregate draw per period
+        self.assertEqual(drawn["agg_gro"].shape, (3,))
+        # periods are independent draws, not copies
+        self.assertFalse(np.array_equal(drawn["theta"][0], drawn["theta"][1]))
+
 
 class test_simulate_dynamics(unittest.TestCase):
     def test_simulate_dynamics(self):
@@ -54,6 +68,34 @@ class test_simulate_dynamics(unittest.TestCase):
 
         self.assertAlmostEqual(post["cNrm"], 0.98388429)
 
+    def test_parameter_names_are_cached(self):
+        growth = lambda gamma, psi: gamma * psi  # noqa: E731
+        dynamics = {"G": growth}
+
+        simulate_dynamics(dynamics, cons_pre, {})
+        self.assertEqual(block._PARAMETER_NAMES[growth], ("gamma", "psi"))
+
+        # The second call reuses the cached names without inspecting again.
+        with mock.patch.object(block, "signature", side_effect=AssertionError):
+            post = simulate_dynamics(dynamics, cons_pre, {})
+        self.assertAlmostEqual(post["G"], 1.1 * 1.1)
+
+    def test_parameter_names_without_weakref(self):
+        class Double:
+            # no __weakref__ slot, so it cannot key the cache
+            __slots__ = ()
+
+            def __call__(self, aNrm):
+                return 2 * aNrm
+
+        with self.assertRaises(TypeError):
+            weakref.ref(Double())
+
+        post = simulate_dynamics({"bNrm": Double()}, cons_pre, {})
+
+        self.assertEqual(block._parameter_names(Double()), ("aNrm",))
+        self.assertEqual(post["bNrm"], 2)
+
 
 class test_MonteCarloSimulatorWithLiveShock(unittest.TestCase):
     def setUp(self):